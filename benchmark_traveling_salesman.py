@@ -1,15 +1,30 @@
-from traveling_salesman import traveling_salesman, hand_rolled_traveling_salesman
+import pytest
+
+from traveling_salesman import (
+    traveling_salesman,
+    hand_rolled_traveling_salesman,
+    lazy_traveling_salesman,
+)
 from typing import Tuple
 
+# Benchmark sizes. n=8 matches the Rust benchmark; the larger sizes are where
+# the O(n^2 * 2^n) dynamic-programming variants pull away from the O(n!)
+# permutation scan (n=12 is 479M permutations but only ~590k DP updates).
+BENCHMARK_SIZES = [6, 8, 10, 12]
+
+# The permutation-scanning variant is only benchmarked up to n=10; beyond
+# that a single pass takes longer than the benchmark budget allows.
+PERMUTATION_SCAN_SIZES = [n for n in BENCHMARK_SIZES if n <= 10]
+
 
-def generate_stress_test_destinations():
-    # Using 8 destinations will give us 8! = 40320 permutations
-    # This matches the Rust benchmark
-    return list(range(1, 9))
+def generate_stress_test_destinations(n):
+    # n destinations gives n! permutations for the brute-force variants
+    return list(range(1, n + 1))
 
 
-def test_traveling_salesman(benchmark):
-    destinations = generate_stress_test_destinations()
+@pytest.mark.parametrize("n", BENCHMARK_SIZES)
+def test_traveling_salesman(benchmark, n):
+    destinations = generate_stress_test_destinations(n)
     start = 0
     end = max(destinations) + 1
 
@@ -27,13 +42,14 @@ def test_traveling_salesman(benchmark):
     )
 
     # Verify the result is correct (should be in ascending order for this case)
-    assert list(result) == [0] + list(range(1, 9)) + [9]
+    assert list(result) == [0] + destinations + [end]
 
 
-def test_hand_rolled(benchmark):
-    destinations = generate_stress_test_destinations()
+@pytest.mark.parametrize("n", BENCHMARK_SIZES)
+def test_hand_rolled(benchmark, n):
+    destinations = generate_stress_test_destinations(n)
     start = 0
-    end = 9
+    end = max(destinations) + 1
 
     def compute_distance(pair: Tuple[int, int]) -> int:
         return abs(pair[0] - pair[1])
@@ -49,10 +65,32 @@ def test_hand_rolled(benchmark):
     )
 
     # Verify the result is correct (should be in ascending order for this case)
-    assert list(result) == [0] + list(range(1, 9)) + [9]
+    assert list(result) == [0] + destinations + [end]
+
+
+@pytest.mark.parametrize("n", PERMUTATION_SCAN_SIZES)
+def test_lazy(benchmark, n):
+    destinations = generate_stress_test_destinations(n)
+    start = 0
+    end = max(destinations) + 1
+
+    def compute_distance(pair: Tuple[int, int]) -> int:
+        return abs(pair[0] - pair[1])
+
+    # Benchmark the permutation scan with pruning and warm start
+    result = benchmark(
+        lambda: list(lazy_traveling_salesman(
+            destinations,
+            start,
+            end,
+            compute_distance
+        ))
+    )
+
+    # Verify the result is correct (should be in ascending order for this case)
+    assert list(result) == [0] + destinations + [end]
 
 
 if __name__ == "__main__":
     # This allows running with python -m pytest benchmark_traveling_salesman.py --benchmark-only
-    import pytest
     pytest.main(['--benchmark-only', __file__])
@@ -0,0 +1,258 @@
+import unittest
+
+from traveling_salesman import (
+    traveling_salesman,
+    hand_rolled_traveling_salesman,
+    lazy_traveling_salesman,
+    branch_and_bound_traveling_salesman,
+    parallel_traveling_salesman,
+    heaps_traveling_salesman,
+    cached_fn,
+    total_distance,
+)
+
+
+class TestTravelingSalesman(unittest.TestCase):
+    def test_traveling_salesman(self):
+        # Test with references (integers)
+        destinations = [1, 2, 3, 4, 5]
+        start = 0
+        end = 6
+
+        # Works with references
+        @cached_fn
+        def compute_distance_ref(pair: tuple[int, int]) -> int:
+            return abs(pair[0] - pair[1])
+
+        result = traveling_salesman(
+            destinations, start, end, compute_distance_ref)
+        self.assertEqual(list(result), [0, 1, 2, 3, 4, 5, 6])
+
+        # Test with different distance function
+        @cached_fn
+        def compute_distance_squared(pair: tuple[int, int]) -> int:
+            return (pair[0] - pair[1]) ** 2
+
+        result = traveling_salesman(
+            destinations, start, end, compute_distance_squared)
+        self.assertEqual(list(result), [0, 1, 2, 3, 4, 5, 6])
+
+    def test_cached_fn(self):
+        call_count = 0
+
+        def count_calls(x: int) -> int:
+            nonlocal call_count
+            call_count += 1
+            return x * 2
+
+        cached_f = cached_fn(count_calls)
+
+        self.assertEqual(cached_f(5), 10)
+        self.assertEqual(cached_f(5), 10)  # Second call uses cache
+        self.assertEqual(call_count, 1)  # Verify f was only called once
+
+    def test_empty_destinations(self):
+        """Test that the function handles empty destinations correctly"""
+        destinations = []
+        start = 0
+        end = 1
+
+        @cached_fn
+        def compute_distance(pair: tuple[int, int]) -> int:
+            return abs(pair[0] - pair[1])
+
+        result = traveling_salesman(destinations, start, end, compute_distance)
+        self.assertEqual(result, [0, 1])
+
+    def test_single_destination(self):
+        """Test that the function works correctly with a single destination"""
+        destinations = [1]
+        start = 0
+        end = 2
+
+        @cached_fn
+        def compute_distance(pair: tuple[int, int]) -> int:
+            return abs(pair[0] - pair[1])
+
+        result = traveling_salesman(destinations, start, end, compute_distance)
+        self.assertEqual(list(result), [0, 1, 2])
+
+    def test_hand_rolled_traveling_salesman(self):
+        # Test with hand-rolled version
+        # random destinations of 5 values
+        destinations = [10, 23, 13, 94, 35]
+        start = 0
+        end = 6
+
+        def compute_distance(pair: tuple[int, int]) -> int:
+            return abs(pair[0] - pair[1])
+
+        hand_result = hand_rolled_traveling_salesman(
+            destinations, start, end, compute_distance)
+        other_result = traveling_salesman(
+            destinations, start, end, compute_distance)
+        # Multiple routes can tie for the optimum, so compare total distance
+        # and the set of visited nodes rather than the exact route chosen.
+        self.assertEqual(
+            total_distance(hand_result, compute_distance),
+            total_distance(other_result, compute_distance),
+            "Hand-rolled version should match the main function result.")
+        self.assertEqual(sorted(hand_result), sorted(other_result))
+        self.assertEqual(hand_result[0], start)
+        self.assertEqual(hand_result[-1], end)
+
+    def test_branch_and_bound_traveling_salesman(self):
+        # Branch-and-bound should find a tour as short as the exact DP
+        destinations = [10, 23, 13, 94, 35]
+        start = 0
+        end = 6
+
+        def compute_distance(pair: tuple[int, int]) -> int:
+            return abs(pair[0] - pair[1])
+
+        bb_result = branch_and_bound_traveling_salesman(
+            destinations, start, end, compute_distance)
+        exact_result = hand_rolled_traveling_salesman(
+            destinations, start, end, compute_distance)
+        self.assertEqual(
+            total_distance(bb_result, compute_distance),
+            total_distance(exact_result, compute_distance),
+            "Branch-and-bound should find an optimal tour.")
+        self.assertEqual(sorted(bb_result), sorted(exact_result))
+        self.assertEqual(bb_result[0], start)
+        self.assertEqual(bb_result[-1], end)
+
+    def test_parallel_traveling_salesman(self):
+        # Six destinations so the process pool path is exercised
+        destinations = [10, 23, 13, 94, 35, 57]
+        start = 0
+        end = 6
+
+        def compute_distance(pair: tuple[int, int]) -> int:
+            return abs(pair[0] - pair[1])
+
+        parallel_result = parallel_traveling_salesman(
+            destinations, start, end, compute_distance)
+        exact_result = hand_rolled_traveling_salesman(
+            destinations, start, end, compute_distance)
+        self.assertEqual(
+            total_distance(parallel_result, compute_distance),
+            total_distance(exact_result, compute_distance),
+            "Parallel version should find an optimal tour.")
+        self.assertEqual(sorted(parallel_result), sorted(exact_result))
+
+    def test_heaps_traveling_salesman(self):
+        destinations = [10, 23, 13, 94, 35]
+        start = 0
+        end = 6
+
+        def compute_distance(pair: tuple[int, int]) -> int:
+            return abs(pair[0] - pair[1])
+
+        heaps_result = heaps_traveling_salesman(
+            destinations, start, end, compute_distance)
+        exact_result = hand_rolled_traveling_salesman(
+            destinations, start, end, compute_distance)
+        self.assertEqual(
+            total_distance(heaps_result, compute_distance),
+            total_distance(exact_result, compute_distance),
+            "Heap's-algorithm version should find an optimal tour.")
+        self.assertEqual(sorted(heaps_result), sorted(exact_result))
+
+    def test_vectorized_traveling_salesman(self):
+        try:
+            from traveling_salesman_numpy import vectorized_traveling_salesman
+        except ImportError:
+            self.skipTest("numpy is not installed")
+
+        destinations = [10, 23, 13, 94, 35]
+        start = 0
+        end = 6
+
+        def compute_distance(pair: tuple[int, int]) -> int:
+            return abs(pair[0] - pair[1])
+
+        vectorized_result = vectorized_traveling_salesman(
+            destinations, start, end, compute_distance)
+        exact_result = hand_rolled_traveling_salesman(
+            destinations, start, end, compute_distance)
+        self.assertEqual(
+            total_distance(vectorized_result, compute_distance),
+            total_distance(exact_result, compute_distance),
+            "Vectorized version should find an optimal tour.")
+        self.assertEqual(sorted(vectorized_result), sorted(exact_result))
+
+
+class TestLazyTravelingSalesman(unittest.TestCase):
+    def test_lazy_traveling_salesman(self):
+        # Test with references (integers)
+        destinations = [1, 2, 3, 4, 5]
+        start = 0
+        end = 6
+
+        @cached_fn
+        def compute_distance_ref(pair: tuple[int, int]) -> int:
+            return abs(pair[0] - pair[1])
+
+        result = list(lazy_traveling_salesman(
+            destinations, start, end, compute_distance_ref))
+        self.assertEqual(result, [0, 1, 2, 3, 4, 5, 6])
+
+    def test_lazy_empty_destinations(self):
+        """Test that the lazy function handles empty destinations correctly"""
+        destinations = []
+        start = 0
+        end = 1
+
+        @cached_fn
+        def compute_distance(pair: tuple[int, int]) -> int:
+            return abs(pair[0] - pair[1])
+
+        result = list(lazy_traveling_salesman(
+            destinations, start, end, compute_distance))
+        self.assertEqual(result, [0, 1])
+
+    def test_lazy_single_destination(self):
+        """Test that the lazy function works correctly with a single destination"""
+        destinations = [1]
+        start = 0
+        end = 2
+
+        @cached_fn
+        def compute_distance(pair: tuple[int, int]) -> int:
+            return abs(pair[0] - pair[1])
+
+        result = list(lazy_traveling_salesman(
+            destinations, start, end, compute_distance))
+        self.assertEqual(result, [0, 1, 2])
+
+    def test_compare_implementations(self):
+        """Test that the lazy and original implementations produce the same result"""
+        # Test with a non-trivial set of destinations
+        destinations = [10, 23, 13, 94, 35]
+        start = 0
+        end = 6
+
+        @cached_fn
+        def compute_distance(pair: tuple[int, int]) -> int:
+            return abs(pair[0] - pair[1])
+
+        # Save original implementation
+        original_result = hand_rolled_traveling_salesman(
+            destinations, start, end, compute_distance)
+
+        # Get lazy implementation result
+        lazy_result = list(lazy_traveling_salesman(
+            destinations, start, end, compute_distance))
+
+        # Both should find an optimal path; ties may be broken differently,
+        # so compare the total distance and the set of visited nodes.
+        self.assertEqual(
+            total_distance(lazy_result, compute_distance),
+            total_distance(original_result, compute_distance),
+            "Lazy implementation should match the hand-rolled implementation result.")
+        self.assertEqual(sorted(lazy_result), sorted(original_result))
+
+
+if __name__ == '__main__':
+    unittest.main()
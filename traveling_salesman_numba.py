@@ -0,0 +1,99 @@
+import numpy as np
+from numba import njit
+from typing import Callable, List, Optional, TypeVar
+
+T = TypeVar('T')
+Distance = TypeVar('Distance')
+
+
+@njit(cache=True)
+def _tsp_held_karp(dist: np.ndarray, n: int) -> np.ndarray:
+    """
+    Held-Karp bitmask DP over a precomputed (n+2)x(n+2) distance matrix.
+
+    Row/column 0 is the start node, 1..n are the inner destinations, and
+    n+1 is the end node. Runs entirely in compiled code, so the ~n^2*2^n
+    inner updates pay no interpreter overhead. Returns the optimal visiting
+    order of the inner destinations as 0-based indices into that list.
+    """
+    infinity = np.inf
+    dp = np.full((1 << n, n), infinity)
+    parent = np.full((1 << n, n), -1, dtype=np.int64)
+
+    # Base case: go straight from start to each inner city.
+    for i in range(n):
+        dp[1 << i, i] = dist[0, i + 1]
+
+    # Extend each reachable (mask, last) state by one unvisited city.
+    for mask in range(1, 1 << n):
+        for i in range(n):
+            if not (mask >> i) & 1:
+                continue
+            cost_so_far = dp[mask, i]
+            if cost_so_far == infinity:
+                continue
+            for j in range(n):
+                if (mask >> j) & 1:
+                    continue
+                new_cost = cost_so_far + dist[i + 1, j + 1]
+                new_mask = mask | (1 << j)
+                if new_cost < dp[new_mask, j]:
+                    dp[new_mask, j] = new_cost
+                    parent[new_mask, j] = i
+
+    # Close the path: add the leg from each possible final city to end.
+    full_mask = (1 << n) - 1
+    min_distance = infinity
+    last = -1
+    for i in range(n):
+        total = dp[full_mask, i] + dist[i + 1, n + 1]
+        if total < min_distance:
+            min_distance = total
+            last = i
+
+    # Walk the parent pointers backwards to reconstruct the optimal order.
+    order = np.empty(n, dtype=np.int64)
+    mask = full_mask
+    for position in range(n - 1, -1, -1):
+        order[position] = last
+        previous = parent[mask, last]
+        mask ^= 1 << last
+        last = previous
+
+    return order
+
+
+def numba_traveling_salesman(
+    inner_destinations: List[T],
+    start: T,
+    end: T,
+    compute_distance: Callable[[tuple[T, T]], Distance]
+) -> Optional[List[T]]:
+    """
+    Numba-accelerated version of the traveling salesman function.
+
+    Precomputes the distance matrix in Python (one `compute_distance` call
+    per ordered pair), then runs the Held-Karp search in a jitted kernel.
+    Distances are stored as float64, so any numeric distance function works.
+
+    Args:
+        inner_destinations: The destinations to visit.
+        start: The starting destination.
+        end: The ending destination.
+        compute_distance: A function that computes the distance between two destinations.
+
+    Returns:
+        The shortest path that visits all of the inner destinations starting at `start` and ending at `end`.
+    """
+    destinations_count = len(inner_destinations)
+    if destinations_count == 0:
+        return [start, end]
+
+    # Built inline rather than via traveling_salesman._distance_matrix to
+    # avoid a circular import between the two modules.
+    nodes = [start] + list(inner_destinations) + [end]
+    dist = np.array([[compute_distance((a, b)) for b in nodes]
+                     for a in nodes], dtype=np.float64)
+
+    order = _tsp_held_karp(dist, destinations_count)
+    return [start] + [inner_destinations[i] for i in order] + [end]
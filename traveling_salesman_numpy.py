@@ -0,0 +1,65 @@
+import itertools
+from typing import Callable, List, Optional, TypeVar
+
+import numpy as np
+
+T = TypeVar('T')
+Distance = TypeVar('Distance')
+
+# Permutations evaluated per vectorized batch. Large enough that the numpy
+# reductions dominate the Python-side chunk materialization, small enough to
+# stay cache-friendly.
+_CHUNK_SIZE = 4096
+
+
+def vectorized_traveling_salesman(
+    inner_destinations: List[T],
+    start: T,
+    end: T,
+    compute_distance: Callable[[tuple[T, T]], Distance]
+) -> Optional[List[T]]:
+    """
+    A numpy-vectorized version of the traveling salesman function.
+
+    Permutations are drawn in chunks into a 2D index array and the cost of
+    every route in a chunk is computed with one fancy-indexed reduction over
+    the precomputed distance matrix, so the per-permutation Python loop
+    disappears. For n=8 the 40320 permutations become ~10 C-level reductions.
+
+    Args:
+        inner_destinations: The destinations to visit.
+        start: The starting destination.
+        end: The ending destination.
+        compute_distance: A function that computes the distance between two destinations.
+
+    Returns:
+        The shortest path that visits all of the inner destinations starting at `start` and ending at `end`.
+    """
+    destinations_count = len(inner_destinations)
+    if destinations_count == 0:
+        return [start, end]
+
+    nodes = [start] + list(inner_destinations) + [end]
+    dist = np.array([[compute_distance((a, b)) for b in nodes]
+                     for a in nodes], dtype=np.float64)
+    end_index = destinations_count + 1
+
+    best_cost = np.inf
+    best_permutation = None
+
+    permutations = itertools.permutations(range(1, end_index))
+    while True:
+        chunk = list(itertools.islice(permutations, _CHUNK_SIZE))
+        if not chunk:
+            break
+        routes = np.array(chunk, dtype=np.intp)
+        # Inner legs, plus the start and end legs, for the whole chunk at once.
+        costs = (dist[routes[:, :-1], routes[:, 1:]].sum(axis=1)
+                 + dist[0, routes[:, 0]]
+                 + dist[routes[:, -1], end_index])
+        winner = int(np.argmin(costs))
+        if costs[winner] < best_cost:
+            best_cost = float(costs[winner])
+            best_permutation = chunk[winner]
+
+    return [start] + [nodes[i] for i in best_permutation] + [end]